@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 import os
 import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict
@@ -11,11 +12,20 @@ from zoneinfo import ZoneInfo
 
 import requests
 
+try:  # orjson is an optional, faster drop-in for decoding token responses.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised in environments without orjson
+    from json import loads as _json_loads
+
 GRAPH_SCOPE = "https://graph.microsoft.com/.default"
 TOKEN_URL_TEMPLATE = "https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token"
 MESSAGE_URL_TEMPLATE = (
     "https://graph.microsoft.com/v1.0/teams/{team_id}/channels/{channel_id}/messages"
 )
+# Refresh cached tokens this many seconds before they actually expire.
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+# Assumed token lifetime when the response has no usable ``expires_in``.
+DEFAULT_TOKEN_LIFETIME_SECONDS = 3600
 
 
 class ConfigurationError(Exception):
@@ -94,6 +104,9 @@ class TeamsNotifier:
     def __init__(self, config: TeamsConfig):
         self.config = config
         self.timezone = _get_timezone(config.timezone)
+        self._session = requests.Session()
+        self._session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        self._token: tuple[str, float] | None = None
 
     def run(self) -> None:
         access_token = self._obtain_access_token()
@@ -103,7 +116,7 @@ class TeamsNotifier:
         )
         payload = {"body": {"content": self.config.message_text}}
 
-        response = requests.post(
+        response = self._session.post(
             message_url,
             headers={"Authorization": f"Bearer {access_token}"},
             json=payload,
@@ -118,6 +131,9 @@ class TeamsNotifier:
         print(f"Message sent at {local_time} to channel {self.config.channel_id}.")
 
     def _obtain_access_token(self) -> str:
+        if self._token and time.monotonic() < self._token[1]:
+            return self._token[0]
+
         token_url = TOKEN_URL_TEMPLATE.format(tenant_id=self.config.tenant_id)
         if self.config.auth_mode == "client_credentials":
             data = {
@@ -137,16 +153,25 @@ class TeamsNotifier:
             if self.config.redirect_uri:
                 data["redirect_uri"] = self.config.redirect_uri
 
-        response = requests.post(token_url, data=data, timeout=30)
+        response = self._session.post(token_url, data=data, timeout=30)
         if response.status_code >= 400:
             raise RuntimeError(
                 f"Failed to obtain access token ({response.status_code}): {response.text}"
             )
 
-        token_body: Dict[str, Any] = response.json()
+        token_body: Dict[str, Any] = _json_loads(response.content)
         access_token = token_body.get("access_token")
         if not access_token:
             raise RuntimeError(f"Token response missing access_token: {json.dumps(token_body)}")
+
+        try:
+            expires_in = int(token_body.get("expires_in", DEFAULT_TOKEN_LIFETIME_SECONDS))
+        except (TypeError, ValueError):
+            expires_in = DEFAULT_TOKEN_LIFETIME_SECONDS
+        self._token = (
+            access_token,
+            time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN_SECONDS,
+        )
         return access_token
 
 
@@ -9,8 +9,14 @@ internally.
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Sequence, Set
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+from urllib.parse import quote
 
 try:
     import requests
@@ -22,21 +28,109 @@ except ImportError as exc:  # pragma: no cover - exercised in environments witho
 
 from urllib3.util.retry import Retry
 
+try:  # orjson is an optional, faster drop-in for decoding Graph payloads.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised in environments without orjson
+    from json import loads as _json_loads
+
+try:  # cachecontrol is optional and only needed when ``http_cache_dir`` is set.
+    from cachecontrol import CacheControlAdapter
+    from cachecontrol.caches import FileCache
+except ImportError:  # pragma: no cover - exercised in environments without cachecontrol
+    CacheControlAdapter = None
+    FileCache = None
+
 
 DEFAULT_BASE_URL = "https://graph.microsoft.com/v1.0"
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+# Graph rejects JSON batches with more than 20 subrequests.
+BATCH_MAX_REQUESTS = 20
+# Subrequest statuses re-queued with backoff, matching the adapter's retries.
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Only the fields read by ``_extract_liker_ids`` are requested, with a larger
+# page size than the server default to cut down on pagination round-trips.
+REACTIONS_PAGE_SIZE = 200
+_REACTIONS_QUERY = f"$select=reactionType,user,createdBy&$top={REACTIONS_PAGE_SIZE}"
+
+# Only ``displayName`` is read from user profiles.
+_USER_SELECT = "?$select=displayName"
+
+# Reaction types (lower-cased) counted as a like.
+_LIKE_REACTION_TYPES = frozenset({"like", "thumbsup", "thumbs_up"})
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Server-side ``$filter`` so non-like reactions are not downloaded at all.
+# OData ``eq`` is case-sensitive, so every spelling of the accepted types is
+# listed explicitly. ``_extract_liker_ids`` still filters client-side.
+_LIKE_FILTER_SPELLINGS = (
+    "like",
+    "Like",
+    "LIKE",
+    "thumbsup",
+    "thumbsUp",
+    "ThumbsUp",
+    "THUMBSUP",
+    "thumbs_up",
+    "Thumbs_Up",
+    "THUMBS_UP",
+)
+_LIKE_FILTER = quote(
+    " or ".join(f"reactionType eq '{value}'" for value in _LIKE_FILTER_SPELLINGS)
+)
+
+# Connection pool shared by every client-built session. ``pool_block`` makes
+# callers wait for a free connection instead of opening unbounded sockets.
+# Keep this at or above the default ``max_concurrency`` so lookup threads do
+# not contend for connections.
+POOL_MAXSIZE = 20
+
+# Number of body bytes included in error logs.
+_ERROR_BODY_PREVIEW = 512
+
+
+def _build_retry(max_retries: int, backoff_factor: float) -> Retry:
+    # POST is retried as well: ``$batch`` only carries idempotent GETs.
+    return Retry(
+        total=max_retries,
+        read=max_retries,
+        connect=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _build_adapter(retry: Retry) -> HTTPAdapter:
+    return HTTPAdapter(
+        max_retries=retry,
+        pool_connections=POOL_MAXSIZE,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=True,
+    )
 
 
-def _default_logger() -> logging.Logger:
-    logger = logging.getLogger(__name__)
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+def _build_cache_adapter(cache_dir: str, retry: Retry) -> HTTPAdapter:
+    if CacheControlAdapter is None:
+        raise ImportError(
+            "The 'cachecontrol' package is required for http_cache_dir. "
+            "Install it with 'pip install cachecontrol[filecache]'."
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
-    return logger
+    return CacheControlAdapter(
+        cache=FileCache(cache_dir),
+        max_retries=retry,
+        pool_connections=POOL_MAXSIZE,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=True,
+    )
+
+
+_DEFAULT_RETRY = _build_retry(DEFAULT_MAX_RETRIES, DEFAULT_BACKOFF_FACTOR)
+_SHARED_ADAPTER = _build_adapter(_DEFAULT_RETRY)
 
 
 @dataclass
@@ -52,34 +146,87 @@ class TeamsReactionsClient:
         Base URL for the Graph endpoint. Defaults to the v1.0 API.
     session:
         Optional ``requests.Session`` to reuse connections. When omitted, a
-        session with retry support is created automatically.
+        session with retry support is created automatically; such sessions
+        share one bounded connection pool when default retry settings are used.
     logger:
-        Logger used for diagnostic output. A default logger writing to stdout is
-        created when omitted.
+        Logger used for diagnostic output. Defaults to the module logger;
+        handlers and levels are left to the application's logging setup.
     max_retries:
-        Maximum number of retries for transient failures.
+        Maximum number of retries for transient failures. Client-built
+        sessions with non-default retry settings get their own adapter and
+        connection pool instead of the shared one.
     backoff_factor:
         Factor for exponential backoff between retries.
     request_timeout:
         Timeout (seconds) for each HTTP request.
+    use_batch:
+        Resolve display names through Graph ``$batch`` requests. When
+        disabled, users are looked up individually on a thread pool.
+    max_concurrency:
+        Number of worker threads resolving display names (one ``$batch``
+        request or individual lookup per worker) while reactions are still
+        being paged. Capped at :data:`POOL_MAXSIZE`.
+    name_cache_size:
+        Maximum number of resolved display names kept in the client's LRU
+        cache, so repeat calls skip lookups for known users. ``0`` disables
+        caching.
+    name_cache_ttl:
+        Optional lifetime (seconds) of cached display names. Entries never
+        expire when omitted.
+    http_cache_dir:
+        Directory for an on-disk HTTP cache of GET responses (requires the
+        optional ``cachecontrol`` package). Cached responses are revalidated
+        with ``If-None-Match`` so unchanged resources come back as 304s.
+        Disabled when omitted. Cannot be combined with ``session``.
+        Entries are keyed by URL only, not by ``Authorization``, and hold
+        user profiles and reactions (personal data) on disk. Use a separate,
+        access-restricted directory per token/tenant so one principal's
+        responses are never served to another.
+    server_side_filter:
+        Ask Graph to return only like reactions via ``$filter``. The match is
+        case-sensitive on the server, so only the spellings in
+        ``_LIKE_FILTER_SPELLINGS`` are returned; disable this if reactions use
+        other casings. If the server rejects the filter, the client falls back
+        to client-side filtering for the rest of its lifetime.
     """
 
     access_token: str
     base_url: str = DEFAULT_BASE_URL
     session: Optional[requests.Session] = None
-    logger: logging.Logger = field(default_factory=_default_logger)
-    max_retries: int = 3
-    backoff_factor: float = 0.5
+    logger: logging.Logger = field(default_factory=lambda: logging.getLogger(__name__))
+    max_retries: int = DEFAULT_MAX_RETRIES
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR
     request_timeout: int = 10
+    use_batch: bool = True
+    max_concurrency: int = 8
+    name_cache_size: int = 1024
+    name_cache_ttl: Optional[float] = None
+    server_side_filter: bool = True
+    http_cache_dir: Optional[str] = None
 
     def __post_init__(self) -> None:
         self.base_url = self.base_url.rstrip("/")
+        # Built once; user URLs are assembled per liker in the lookup path.
+        self._users_url_prefix = f"{self.base_url}/users/"
+        self._batch_url = f"{self.base_url}/$batch"
+        self._server_filter_supported = True
+        # user id -> (display name, monotonic expiry or None)
+        self._name_cache: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        # The client may be shared across threads; guards every cache access.
+        self._name_cache_lock = threading.Lock()
         if self.session is None:
             self.session = self._build_session()
+        elif self.http_cache_dir is not None:
+            raise ValueError(
+                "http_cache_dir only applies to client-built sessions; "
+                "mount a caching adapter on the provided session instead."
+            )
         self.session.headers.update(
             {
                 "Authorization": f"Bearer {self.access_token}",
                 "Accept": "application/json",
+                # Reaction pages compress well; don't rely on proxies keeping it.
+                "Accept-Encoding": "gzip, deflate",
             }
         )
         self.logger.debug("TeamsReactionsClient initialized with base_url=%s", self.base_url)
@@ -92,56 +239,127 @@ class TeamsReactionsClient:
         ``teams/{team-id}/channels/{channel-id}/messages/{message-id}``.
         """
 
-        reactions_url = self._build_reactions_url(message_resource)
+        first_page = self._fetch_first_reactions_page(message_resource)
+        names = self._collect_liker_names(first_page)
+
+        # Ids are already unique; this only collapses distinct users sharing a
+        # display name and drops unresolved ones, keeping first-seen order.
+        return list(dict.fromkeys(filter(None, names)))
+
+    def _fetch_first_reactions_page(self, message_resource: str) -> Dict:
+        """Fetch the first reactions page, dropping ``$filter`` if it is rejected.
+
+        Only this request decides whether the server supports the filter;
+        errors from later pages or from name lookups propagate unchanged.
+        """
+
+        use_filter = self.server_side_filter and self._server_filter_supported
+        reactions_url = self._build_reactions_url(message_resource, server_filter=use_filter)
         self.logger.info("Fetching reactions from %s", reactions_url)
 
-        reactions = self._collect_reactions(reactions_url)
-        liker_ids = self._extract_liker_ids(reactions)
-        self.logger.info("Found %d unique users who liked the message", len(liker_ids))
+        try:
+            return self._get_json(reactions_url, context="reactions page")
+        except requests.HTTPError as exc:
+            if not use_filter or not _is_filter_rejection(exc.response):
+                raise
+            self.logger.warning(
+                "Reaction $filter rejected by server; filtering reactions client-side"
+            )
+            self._server_filter_supported = False
+            return self._get_json(
+                self._build_reactions_url(message_resource), context="reactions page"
+            )
 
-        display_names: List[str] = []
-        seen_names: Set[str] = set()
-        for user_id in liker_ids:
-            name = self._fetch_user_display_name(user_id)
-            if name and name not in seen_names:
-                display_names.append(name)
-                seen_names.add(name)
+    def _collect_liker_names(self, first_page: Dict) -> List[Optional[str]]:
+        """Page through reactions while resolving names of the likers found so far.
 
-        return display_names
+        Lookups for each page's new liker ids are submitted to a thread pool as
+        soon as the page arrives, so name resolution overlaps with fetching the
+        remaining pages. Only one page of reactions is held in memory at a time.
+        Returns names aligned with the unique liker ids in first-seen order.
+        """
+
+        liker_ids: List[str] = []
+        seen: Set[str] = set()
+        resolved: Dict[str, Optional[str]] = {}
+        submitted: List[Tuple[List[str], Future]] = []
+        chunk_size = BATCH_MAX_REQUESTS if self.use_batch else 1
+        max_workers = max(1, min(self.max_concurrency, POOL_MAXSIZE))
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for page in self._iter_reaction_pages(first_page):
+                new_ids = self._extract_liker_ids(page, seen)
+                liker_ids.extend(new_ids)
+
+                now = time.monotonic()
+                misses: List[str] = []
+                for user_id in new_ids:
+                    name = self._cached_display_name(user_id, now)
+                    if name is None:
+                        misses.append(user_id)
+                    else:
+                        resolved[user_id] = name
+
+                for start in range(0, len(misses), chunk_size):
+                    chunk = misses[start : start + chunk_size]
+                    submitted.append((chunk, executor.submit(self._resolve_user_chunk, chunk)))
+
+            self.logger.info("Found %d unique users who liked the message", len(liker_ids))
+            for chunk, future in submitted:
+                for user_id, name in zip(chunk, future.result()):
+                    resolved[user_id] = name
+                    if name:
+                        self._cache_display_name(user_id, name)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return [resolved.get(user_id) for user_id in liker_ids]
 
     def _build_session(self) -> requests.Session:
         session = requests.Session()
-        retry_strategy = Retry(
-            total=self.max_retries,
-            read=self.max_retries,
-            connect=self.max_retries,
-            backoff_factor=self.backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-            respect_retry_after_header=True,
-            raise_on_status=False,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        retry = _DEFAULT_RETRY
+        if (self.max_retries, self.backoff_factor) != (
+            DEFAULT_MAX_RETRIES,
+            DEFAULT_BACKOFF_FACTOR,
+        ):
+            retry = _build_retry(self.max_retries, self.backoff_factor)
+
+        if self.http_cache_dir is not None:
+            adapter = _build_cache_adapter(self.http_cache_dir, retry)
+        elif retry is _DEFAULT_RETRY:
+            adapter = _SHARED_ADAPTER
+        else:
+            adapter = _build_adapter(retry)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         return session
 
-    def _build_reactions_url(self, message_resource: str) -> str:
+    def _build_reactions_url(self, message_resource: str, *, server_filter: bool = False) -> str:
         message_path = message_resource.strip("/")
-        return f"{self.base_url}/{message_path}/reactions"
+        url = f"{self.base_url}/{message_path}/reactions?{_REACTIONS_QUERY}"
+        if server_filter:
+            url += f"&$filter={_LIKE_FILTER}"
+        return url
 
-    def _collect_reactions(self, url: str) -> List[Dict]:
-        reactions: List[Dict] = []
-        next_url: Optional[str] = url
+    def _iter_reaction_pages(self, first_page: Dict) -> Iterator[List[Dict]]:
+        # ``@odata.nextLink`` already carries the query options and skip token,
+        # so only the initial URL is built locally.
+        payload: Optional[Dict] = first_page
 
-        while next_url:
-            payload = self._get_json(next_url, context="reactions page")
+        while True:
             page_reactions = payload.get("value", []) if payload else []
-            self.logger.debug("Received %d reactions", len(page_reactions))
-            reactions.extend(page_reactions)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Received %d reactions",
+                    len(page_reactions),
+                    extra={"reaction_count": len(page_reactions)},
+                )
             next_url = payload.get("@odata.nextLink") if payload else None
-
-        return reactions
+            yield page_reactions
+            if not next_url:
+                return
+            payload = self._get_json(next_url, context="reactions page")
 
     def _get_json(self, url: str, *, context: str) -> Dict:
         try:
@@ -149,13 +367,25 @@ class TeamsReactionsClient:
         except requests.RequestException as exc:
             self.logger.warning("Request for %s failed: %s", context, exc)
             raise
+        return self._decode_response(response, context=context)
+
+    def _post_json(self, url: str, payload: Dict, *, context: str) -> Dict:
+        try:
+            response = self.session.post(url, json=payload, timeout=self.request_timeout)
+        except requests.RequestException as exc:
+            self.logger.warning("Request for %s failed: %s", context, exc)
+            raise
+        return self._decode_response(response, context=context)
+
+    def _decode_response(self, response: requests.Response, *, context: str) -> Dict:
+        body = response.content
 
-        if 500 <= response.status_code < 600:
+        if 500 <= response.status_code < 600 and self.logger.isEnabledFor(logging.WARNING):
             self.logger.warning(
                 "Transient error for %s (status %s): %s",
                 context,
                 response.status_code,
-                response.text,
+                _body_preview(body),
             )
 
         if not response.ok:
@@ -163,25 +393,31 @@ class TeamsReactionsClient:
                 "Failed to fetch %s (status %s): %s",
                 context,
                 response.status_code,
-                response.text,
+                _body_preview(body),
             )
             response.raise_for_status()
 
         try:
-            return response.json()
+            return _json_loads(body)
         except ValueError as exc:
             self.logger.error("Invalid JSON in %s response: %s", context, exc)
             raise
 
-    def _extract_liker_ids(self, reactions: Iterable[Dict]) -> List[str]:
+    def _extract_liker_ids(
+        self, reactions: Iterable[Dict], seen: Optional[Set[str]] = None
+    ) -> List[str]:
+        """Return ids of like reactors not already in ``seen``, updating it."""
+
         liker_ids: List[str] = []
-        seen: Set[str] = set()
+        if seen is None:
+            seen = set()
+        like_types = _LIKE_REACTION_TYPES
         for reaction in reactions:
-            reaction_type = (reaction.get("reactionType") or "").lower()
-            if reaction_type not in {"like", "thumbsup", "thumbs_up"}:
+            reaction_type = reaction.get("reactionType")
+            if not reaction_type or reaction_type.lower() not in like_types:
                 continue
             user_id = (
-                reaction.get("user", {}) or reaction.get("createdBy", {})
+                reaction.get("user") or reaction.get("createdBy") or _EMPTY
             ).get("id")
             if user_id and user_id not in seen:
                 seen.add(user_id)
@@ -189,14 +425,188 @@ class TeamsReactionsClient:
         return liker_ids
 
     def _fetch_user_display_name(self, user_id: str) -> Optional[str]:
-        url = f"{self.base_url}/users/{user_id}"
+        url = self._users_url_prefix + user_id + _USER_SELECT
         self.logger.debug("Fetching display name for user %s", user_id)
-        payload = self._get_json(url, context=f"user {user_id}")
+        try:
+            payload = self._get_json(url, context=f"user {user_id}")
+        except requests.HTTPError as exc:
+            # Mirrors the $batch path: a deleted user is skipped, while auth
+            # and server errors still fail the call.
+            if getattr(exc.response, "status_code", None) != 404:
+                raise
+            self.logger.warning("User %s not found; skipping display name", user_id)
+            return None
         name = payload.get("displayName") if payload else None
         if not name:
             self.logger.warning("Display name missing for user %s", user_id)
         return name
 
+    def _cached_display_name(self, user_id: str, now: float) -> Optional[str]:
+        with self._name_cache_lock:
+            cached = self._name_cache.get(user_id)
+            if cached is None:
+                return None
+            name, expiry = cached
+            if expiry is not None and now >= expiry:
+                del self._name_cache[user_id]
+                return None
+            self._name_cache.move_to_end(user_id)
+            return name
+
+    def _cache_display_name(self, user_id: str, name: str) -> None:
+        if self.name_cache_size <= 0:
+            return
+        expiry = None
+        if self.name_cache_ttl is not None:
+            expiry = time.monotonic() + self.name_cache_ttl
+        with self._name_cache_lock:
+            self._name_cache[user_id] = (name, expiry)
+            self._name_cache.move_to_end(user_id)
+            while len(self._name_cache) > self.name_cache_size:
+                self._name_cache.popitem(last=False)
+
+    def _resolve_user_chunk(self, user_ids: Sequence[str]) -> List[Optional[str]]:
+        # Runs on the lookup thread pool; only does HTTP, cache updates happen
+        # once results are collected.
+        if self.use_batch:
+            return self._fetch_user_display_names_bulk(user_ids)
+        return [self._fetch_user_display_name(user_id) for user_id in user_ids]
+
+    def _fetch_user_display_names_bulk(self, user_ids: Sequence[str]) -> List[Optional[str]]:
+        """Resolve display names through Graph ``$batch`` requests.
+
+        Lookups are sent in chunks of :data:`BATCH_MAX_REQUESTS`. The returned
+        list is aligned with ``user_ids``; unresolved users map to ``None``.
+        """
+
+        names: Dict[str, Optional[str]] = {}
+        for start in range(0, len(user_ids), BATCH_MAX_REQUESTS):
+            names.update(self._post_user_batch(user_ids[start : start + BATCH_MAX_REQUESTS]))
+        return [names.get(user_id) for user_id in user_ids]
+
+    def _post_user_batch(self, user_ids: Sequence[str]) -> Dict[str, Optional[str]]:
+        names: Dict[str, Optional[str]] = {}
+        pending = list(user_ids)
+        attempt = 0
+
+        while pending:
+            payload = {
+                "requests": [
+                    {
+                        "id": str(index),
+                        "method": "GET",
+                        "url": "/users/" + user_id + _USER_SELECT,
+                    }
+                    for index, user_id in enumerate(pending)
+                ]
+            }
+            # The id map is only built for debugging; skip it otherwise.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Posting user batch with %d lookups (attempt %d)",
+                    len(pending),
+                    attempt + 1,
+                    extra={"batch_ids": {str(i): uid for i, uid in enumerate(pending)}},
+                )
+            body = self._post_json(
+                self._batch_url,
+                payload,
+                context=f"user batch ({len(pending)} users)",
+            )
+
+            retryable: List[str] = []
+            retry_after = 0.0
+            for sub_response in body.get("responses", []) if body else []:
+                try:
+                    user_id = pending[int(sub_response.get("id"))]
+                except (TypeError, ValueError, IndexError):
+                    self.logger.warning(
+                        "Ignoring batch response with unknown id %r", sub_response.get("id")
+                    )
+                    continue
+
+                status = sub_response.get("status")
+                if status in _RETRYABLE_STATUSES:
+                    retryable.append(user_id)
+                    retry_after = max(
+                        retry_after, _parse_retry_after(sub_response.get("headers"))
+                    )
+                    continue
+
+                if status == 404:
+                    self.logger.warning("User %s not found; skipping display name", user_id)
+                    names[user_id] = None
+                    continue
+
+                if not isinstance(status, int) or not 200 <= status < 300:
+                    self.logger.error(
+                        "Failed to fetch display name for user %s (status %s)",
+                        user_id,
+                        status,
+                    )
+                    raise requests.HTTPError(
+                        f"Failed to fetch display name for user {user_id} (status {status})"
+                    )
+
+                name = (sub_response.get("body") or {}).get("displayName")
+                if not name:
+                    self.logger.warning("Display name missing for user %s", user_id)
+                names[user_id] = name
+
+            if not retryable:
+                break
+            if attempt >= self.max_retries:
+                self.logger.error(
+                    "Giving up on %d user lookups after %d retries",
+                    len(retryable),
+                    attempt,
+                )
+                raise requests.HTTPError(
+                    f"User batch still failing for {len(retryable)} users after "
+                    f"{attempt} retries"
+                )
+
+            attempt += 1
+            delay = retry_after or self.backoff_factor * (2 ** (attempt - 1))
+            self.logger.info(
+                "Batch lookups failed transiently for %d users; retrying in %.1fs",
+                len(retryable),
+                delay,
+            )
+            time.sleep(delay)
+            pending = retryable
+
+        return names
+
+
+def _body_preview(body: bytes) -> str:
+    return body[:_ERROR_BODY_PREVIEW].decode("utf-8", "replace")
+
+
+def _is_filter_rejection(response: Optional[requests.Response]) -> bool:
+    """Return whether a 400 response blames the ``$filter`` query option."""
+
+    if response is None or response.status_code != 400:
+        return False
+    try:
+        error = _json_loads(response.content).get("error") or {}
+    except (ValueError, AttributeError):
+        return False
+    if not isinstance(error, dict):
+        return False
+    detail = f"{error.get('code') or ''} {error.get('message') or ''}"
+    return "filter" in detail.lower()
+
+
+def _parse_retry_after(headers: Optional[Mapping[str, Any]]) -> float:
+    for key, value in (headers or {}).items():
+        if key.lower() == "retry-after":
+            try:
+                return max(float(value), 0.0)
+            except (TypeError, ValueError):
+                return 0.0
+    return 0.0
+
 
 def list_like_reactors(
     access_token: str,
@@ -205,8 +615,8 @@ def list_like_reactors(
     base_url: str = DEFAULT_BASE_URL,
     logger: Optional[logging.Logger] = None,
     session: Optional[requests.Session] = None,
-    max_retries: int = 3,
-    backoff_factor: float = 0.5,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
     request_timeout: int = 10,
 ) -> List[str]:
     """Convenience wrapper to fetch like/thumbs-up reactors for a message.
@@ -221,7 +631,7 @@ def list_like_reactors(
         access_token=access_token,
         base_url=base_url,
         session=session,
-        logger=logger or _default_logger(),
+        logger=logger or logging.getLogger(__name__),
         max_retries=max_retries,
         backoff_factor=backoff_factor,
         request_timeout=request_timeout,
@@ -0,0 +1,94 @@
+import json
+from typing import List
+
+import pytest
+
+pytest.importorskip("requests")
+
+from automation import teams_notifier
+from automation.teams_notifier import TeamsConfig, TeamsNotifier
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, payload: dict):
+        self.status_code = status_code
+        self._payload = payload
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+
+class _FakeSession:
+    def __init__(self, responses: List[_FakeResponse]):
+        self._responses = responses
+        self.posted_urls: List[str] = []
+        self.headers = {}
+
+    def post(self, url: str, **kwargs):
+        self.posted_urls.append(url)
+        if not self._responses:
+            raise AssertionError("No more fake responses configured")
+        return self._responses.pop(0)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _notifier(monkeypatch, responses: List[_FakeResponse]):
+    clock = _Clock()
+    monkeypatch.setattr(teams_notifier.time, "monotonic", clock)
+    config = TeamsConfig(
+        team_id="team",
+        channel_id="channel",
+        timezone="Asia/Seoul",
+        message_text="hello",
+        auth_mode="client_credentials",
+        tenant_id="tenant",
+        client_id="client",
+        client_secret="secret",
+        refresh_token=None,
+        redirect_uri=None,
+    )
+    notifier = TeamsNotifier(config)
+    notifier._session = _FakeSession(responses)
+    return notifier, clock
+
+
+def _token(value: str, expires_in=3600) -> _FakeResponse:
+    return _FakeResponse(200, {"access_token": value, "expires_in": expires_in})
+
+
+def test_access_token_is_reused_within_expiry_window(monkeypatch):
+    notifier, clock = _notifier(monkeypatch, [_token("first")])
+
+    assert notifier._obtain_access_token() == "first"
+    clock.now += 3600 - 61
+    assert notifier._obtain_access_token() == "first"
+    assert len(notifier._session.posted_urls) == 1
+
+
+def test_access_token_is_refreshed_after_expiry_margin(monkeypatch):
+    notifier, clock = _notifier(monkeypatch, [_token("first"), _token("second")])
+
+    assert notifier._obtain_access_token() == "first"
+    clock.now += 3600 - 60
+    assert notifier._obtain_access_token() == "second"
+    assert len(notifier._session.posted_urls) == 2
+
+
+def test_non_numeric_expires_in_falls_back_to_default(monkeypatch):
+    notifier, clock = _notifier(monkeypatch, [_token("first", expires_in="soon")])
+
+    assert notifier._obtain_access_token() == "first"
+    clock.now += teams_notifier.DEFAULT_TOKEN_LIFETIME_SECONDS - 61
+    assert notifier._obtain_access_token() == "first"
@@ -1,5 +1,9 @@
+import json
 import logging
-from typing import List
+import re
+import threading
+from typing import List, Optional
+from urllib.parse import quote, unquote
 
 import pytest
 
@@ -18,27 +22,96 @@ class _FakeResponse:
         return 200 <= self.status_code < 300
 
     @property
-    def text(self) -> str:
-        return str(self._payload)
-
-    def json(self) -> dict:
-        return self._payload
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
 
     def raise_for_status(self) -> None:
-        raise requests.HTTPError(f"status {self.status_code}")
+        raise requests.HTTPError(f"status {self.status_code}", response=self)
+
+
+_LIKE_SPELLINGS = (
+    "like",
+    "Like",
+    "LIKE",
+    "thumbsup",
+    "thumbsUp",
+    "ThumbsUp",
+    "THUMBSUP",
+    "thumbs_up",
+    "Thumbs_Up",
+    "THUMBS_UP",
+)
+_REACTIONS_QUERY = "?$select=reactionType,user,createdBy&$top=200&$filter=" + quote(
+    " or ".join(f"reactionType eq '{value}'" for value in _LIKE_SPELLINGS)
+)
+
+
+def _apply_reaction_filter(url: str, response: _FakeResponse) -> _FakeResponse:
+    """Apply a ``$filter`` on reactionType the way Graph would (case-sensitive)."""
+
+    match = re.search(r"[?&]\$filter=([^&]*)", url)
+    if not match or "value" not in response._payload:
+        return response
+    allowed = set(re.findall(r"reactionType eq '([^']*)'", unquote(match.group(1))))
+    payload = dict(response._payload)
+    payload["value"] = [r for r in payload["value"] if r.get("reactionType") in allowed]
+    return _FakeResponse(response.status_code, payload)
 
 
 class _FakeSession:
-    def __init__(self, responses: List[_FakeResponse]):
+    def __init__(
+        self,
+        responses: List[_FakeResponse],
+        post_responses: Optional[List[_FakeResponse]] = None,
+    ):
         self._responses = responses
+        self._post_responses = post_responses or []
         self.requested_urls: List[str] = []
+        self.posted_urls: List[str] = []
+        self.posted_payloads: List[dict] = []
         self.headers = {}
 
     def get(self, url: str, timeout: int):
         self.requested_urls.append(url)
         if not self._responses:
             raise AssertionError("No more fake responses configured")
-        return self._responses.pop(0)
+        return _apply_reaction_filter(url, self._responses.pop(0))
+
+    def post(self, url: str, json: dict, timeout: int):
+        self.posted_urls.append(url)
+        self.posted_payloads.append(json)
+        if not self._post_responses:
+            raise AssertionError("No more fake POST responses configured")
+        return self._post_responses.pop(0)
+
+
+class _RoutingSession:
+    """Fake session answering GETs by URL, safe for concurrent lookups."""
+
+    def __init__(self, routes: dict):
+        self._routes = routes
+        self.requested_urls: List[str] = []
+        self.headers = {}
+
+    def get(self, url: str, timeout: int):
+        self.requested_urls.append(url)
+        if url not in self._routes:
+            raise AssertionError(f"No fake response configured for {url}")
+        return _apply_reaction_filter(url, self._routes[url])
+
+
+def _batch_response(*responses: dict) -> _FakeResponse:
+    return _FakeResponse(200, {"responses": list(responses)})
+
+
+def _user_result(request_id: str, name: str, status: int = 200) -> dict:
+    return {"id": request_id, "status": status, "body": {"displayName": name}}
+
+
+def _likes_page(*user_ids: str) -> _FakeResponse:
+    return _FakeResponse(
+        200, {"value": [{"reactionType": "like", "user": {"id": uid}} for uid in user_ids]}
+    )
 
 
 def test_list_like_reactors_paginates_and_filters():
@@ -57,10 +130,11 @@ def test_list_like_reactors_paginates_and_filters():
             },
         ),
         _FakeResponse(200, {"value": [{"reactionType": "heart", "user": {"id": user1}}]}),
-        _FakeResponse(200, {"displayName": "User One"}),
-        _FakeResponse(200, {"displayName": "User Two"}),
     ]
-    session = _FakeSession(fake_responses)
+    batch_responses = [
+        _batch_response(_user_result("1", "User Two"), _user_result("0", "User One")),
+    ]
+    session = _FakeSession(fake_responses, batch_responses)
     client = TeamsReactionsClient(
         access_token="token",
         session=session,
@@ -70,7 +144,444 @@ def test_list_like_reactors_paginates_and_filters():
     names = client.list_like_reactors("chats/1/messages/abc")
 
     assert names == ["User One", "User Two"]
-    assert reactions_url in session.requested_urls[0]
+    assert session.requested_urls[0] == reactions_url + _REACTIONS_QUERY
+    assert session.requested_urls[1] == reactions_url + "?page=2"
+    assert session.headers["Accept-Encoding"] == "gzip, deflate"
+    assert session.posted_urls == ["https://graph.microsoft.com/v1.0/$batch"]
+    assert [r["url"] for r in session.posted_payloads[0]["requests"]] == [
+        "/users/user-1?$select=displayName",
+        "/users/user-2?$select=displayName",
+    ]
+
+
+def test_server_filter_keeps_every_accepted_spelling():
+    spellings = ["like", "Like", "thumbsup", "thumbsUp", "THUMBS_UP", "heart"]
+    reactions = [
+        {"reactionType": value, "user": {"id": f"u{i}"}} for i, value in enumerate(spellings)
+    ]
+    session = _FakeSession(
+        [_FakeResponse(200, {"value": reactions})],
+        [_batch_response(*(_user_result(str(i), f"Person {i}") for i in range(5)))],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    names = client.list_like_reactors("chats/1/messages/abc")
+
+    assert names == [f"Person {i}" for i in range(5)]
+    assert [r["url"] for r in session.posted_payloads[0]["requests"]] == [
+        f"/users/u{i}?$select=displayName" for i in range(5)
+    ]
+
+
+def test_list_like_reactors_falls_back_when_filter_rejected():
+    reactions_url = "https://graph.microsoft.com/v1.0/chats/1/messages/abc/reactions"
+    like_page = {"value": [{"reactionType": "like", "user": {"id": "u1"}}]}
+    session = _FakeSession(
+        [
+            _FakeResponse(
+                400,
+                {
+                    "error": {
+                        "code": "BadRequest",
+                        "message": "Query option 'Filter' is not allowed.",
+                    }
+                },
+            ),
+            _FakeResponse(200, like_page),
+            _FakeResponse(200, like_page),
+        ],
+        [_batch_response(_user_result("0", "Person"))],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    assert client.list_like_reactors("chats/1/messages/abc") == ["Person"]
+    assert client.list_like_reactors("chats/1/messages/abc") == ["Person"]
+    unfiltered = reactions_url + "?$select=reactionType,user,createdBy&$top=200"
+    assert session.requested_urls[0] == reactions_url + _REACTIONS_QUERY
+    assert session.requested_urls[1] == unfiltered
+    assert session.requested_urls[2] == unfiltered
+
+
+def test_unrelated_bad_request_does_not_disable_reaction_filter():
+    session = _FakeSession(
+        [
+            _FakeResponse(
+                400,
+                {"error": {"code": "BadRequest", "message": "Invalid chat message id."}},
+            )
+        ]
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.list_like_reactors("chats/1/messages/bad")
+
+    assert len(session.requested_urls) == 1
+    assert client._server_filter_supported is True
+
+
+def test_batch_error_does_not_disable_reaction_filter():
+    like_page = {"value": [{"reactionType": "like", "user": {"id": "u1"}}]}
+    session = _FakeSession(
+        [_FakeResponse(200, like_page)],
+        # Even a 400 that mentions the filter must not count when it comes from
+        # a lookup rather than the first reactions page.
+        [_FakeResponse(400, {"error": {"code": "BadRequest", "message": "Invalid filter"}})],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.list_like_reactors("chats/1/messages/abc")
+
+    assert len(session.requested_urls) == 1
+    assert client._server_filter_supported is True
+
+
+def test_bulk_lookup_chunks_and_retries_throttled_users(monkeypatch):
+    sleeps: List[float] = []
+    monkeypatch.setattr("automation.teams_responses.time.sleep", sleeps.append)
+    user_ids = [f"user-{i}" for i in range(22)]
+    first_chunk = [_user_result(str(i), f"Name {i}") for i in range(20)]
+    first_chunk[3] = {"id": "3", "status": 429, "headers": {"Retry-After": "2"}}
+    session = _FakeSession(
+        [],
+        [
+            _batch_response(*first_chunk),
+            _batch_response(_user_result("0", "Name 3")),
+            _batch_response(_user_result("0", "Name 20"), _user_result("1", "Name 21")),
+        ],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    names = client._fetch_user_display_names_bulk(user_ids)
+
+    assert names == [f"Name {i}" for i in range(22)]
+    assert [len(p["requests"]) for p in session.posted_payloads] == [20, 1, 2]
+    assert session.posted_payloads[1]["requests"][0]["url"] == "/users/user-3?$select=displayName"
+    assert sleeps == [2.0]
+
+
+def test_list_like_reactors_without_batch_uses_individual_lookups():
+    base = "https://graph.microsoft.com/v1.0"
+    reactions = [{"reactionType": "like", "user": {"id": f"u{i}"}} for i in range(5)]
+    routes = {
+        f"{base}/chats/1/messages/abc/reactions{_REACTIONS_QUERY}": _FakeResponse(
+            200, {"value": reactions}
+        ),
+    }
+    for i in range(5):
+        routes[f"{base}/users/u{i}?$select=displayName"] = _FakeResponse(
+            200, {"displayName": f"Person {i}"}
+        )
+    session = _RoutingSession(routes)
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+        use_batch=False,
+        max_concurrency=3,
+    )
+
+    names = client.list_like_reactors("chats/1/messages/abc")
+
+    assert names == [f"Person {i}" for i in range(5)]
+    assert len(session.requested_urls) == 6
+
+
+@pytest.mark.parametrize("use_batch", [True, False])
+def test_deleted_user_is_skipped_on_both_lookup_paths(use_batch):
+    base = "https://graph.microsoft.com/v1.0"
+    reactions = [{"reactionType": "like", "user": {"id": uid}} for uid in ("u1", "gone")]
+
+    class _Session(_RoutingSession):
+        def post(self, url: str, json: dict, timeout: int):
+            return _batch_response(
+                _user_result("0", "Person"),
+                {"id": "1", "status": 404, "body": {"error": {"code": "Request_ResourceNotFound"}}},
+            )
+
+    session = _Session(
+        {
+            f"{base}/chats/1/messages/abc/reactions{_REACTIONS_QUERY}": (
+                _FakeResponse(200, {"value": reactions})
+            ),
+            f"{base}/users/u1?$select=displayName": _FakeResponse(200, {"displayName": "Person"}),
+            f"{base}/users/gone?$select=displayName": _FakeResponse(
+                404, {"error": {"code": "Request_ResourceNotFound"}}
+            ),
+        }
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+        use_batch=use_batch,
+    )
+
+    assert client.list_like_reactors("chats/1/messages/abc") == ["Person"]
+
+
+def test_list_like_reactors_collapses_duplicate_and_missing_names():
+    reactions = [{"reactionType": "like", "user": {"id": f"u{i}"}} for i in range(4)]
+    session = _FakeSession(
+        [_FakeResponse(200, {"value": reactions})],
+        [
+            _batch_response(
+                _user_result("0", "Alex"),
+                _user_result("1", "Sam"),
+                _user_result("2", "Alex"),
+                {"id": "3", "status": 404, "body": {}},
+            )
+        ],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    assert client.list_like_reactors("chats/1/messages/abc") == ["Alex", "Sam"]
+
+
+def test_name_lookups_start_before_pagination_finishes():
+    reactions_url = "https://graph.microsoft.com/v1.0/chats/1/messages/abc/reactions"
+    batch_posted = threading.Event()
+
+    class _OrderedSession(_FakeSession):
+        def get(self, url: str, timeout: int):
+            if url.endswith("?page=2"):
+                assert batch_posted.wait(timeout=5), "lookups waited for pagination"
+            return super().get(url, timeout)
+
+        def post(self, url: str, json: dict, timeout: int):
+            response = super().post(url, json, timeout)
+            batch_posted.set()
+            return response
+
+    session = _OrderedSession(
+        [
+            _FakeResponse(
+                200,
+                {
+                    "value": [{"reactionType": "like", "user": {"id": "u1"}}],
+                    "@odata.nextLink": reactions_url + "?page=2",
+                },
+            ),
+            _FakeResponse(200, {"value": [{"reactionType": "like", "user": {"id": "u2"}}]}),
+        ],
+        [
+            _batch_response(_user_result("0", "First")),
+            _batch_response(_user_result("0", "Second")),
+        ],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+        max_concurrency=1,
+    )
+
+    assert client.list_like_reactors("chats/1/messages/abc") == ["First", "Second"]
+
+
+def test_display_names_are_cached_between_calls():
+    like_page = {"value": [{"reactionType": "like", "user": {"id": "u1"}}]}
+    session = _FakeSession(
+        [_FakeResponse(200, like_page), _FakeResponse(200, like_page)],
+        [_batch_response(_user_result("0", "Person"))],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    assert client.list_like_reactors("chats/1/messages/a") == ["Person"]
+    assert client.list_like_reactors("chats/1/messages/b") == ["Person"]
+    assert len(session.posted_payloads) == 1
+
+
+def test_batch_debug_log_carries_subrequest_ids(caplog):
+    session = _FakeSession([], [_batch_response(_user_result("0", "A"), _user_result("1", "B"))])
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="tests.teams_reactions"):
+        client._fetch_user_display_names_bulk(["u1", "u2"])
+
+    [record] = [r for r in caplog.records if hasattr(r, "batch_ids")]
+    assert record.batch_ids == {"0": "u1", "1": "u2"}
+
+
+def test_name_cache_evicts_least_recently_used_entry():
+    session = _FakeSession(
+        [_likes_page("u1", "u2", "u3"), _likes_page("u3"), _likes_page("u1")],
+        [
+            _batch_response(
+                _user_result("0", "One"), _user_result("1", "Two"), _user_result("2", "Three")
+            ),
+            _batch_response(_user_result("0", "One")),
+        ],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+        name_cache_size=2,
+    )
+
+    assert client.list_like_reactors("chats/1/messages/a") == ["One", "Two", "Three"]
+    assert client.list_like_reactors("chats/1/messages/b") == ["Three"]
+    assert client.list_like_reactors("chats/1/messages/c") == ["One"]
+    assert len(session.posted_payloads) == 2
+    assert session.posted_payloads[1]["requests"][0]["url"] == "/users/u1?$select=displayName"
+
+
+def test_expired_cache_entry_is_fetched_again(monkeypatch):
+    clock = {"now": 100.0}
+    monkeypatch.setattr("automation.teams_responses.time.monotonic", lambda: clock["now"])
+    session = _FakeSession(
+        [_likes_page("u1"), _likes_page("u1"), _likes_page("u1")],
+        [_batch_response(_user_result("0", "Old")), _batch_response(_user_result("0", "New"))],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+        name_cache_ttl=30,
+    )
+
+    assert client.list_like_reactors("chats/1/messages/a") == ["Old"]
+    clock["now"] += 29
+    assert client.list_like_reactors("chats/1/messages/a") == ["Old"]
+    clock["now"] += 1
+    assert client.list_like_reactors("chats/1/messages/a") == ["New"]
+    assert len(session.posted_payloads) == 2
+
+
+def test_zero_cache_size_disables_name_cache():
+    session = _FakeSession(
+        [_likes_page("u1"), _likes_page("u1")],
+        [
+            _batch_response(_user_result("0", "Person")),
+            _batch_response(_user_result("0", "Person")),
+        ],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+        name_cache_size=0,
+    )
+
+    assert client.list_like_reactors("chats/1/messages/a") == ["Person"]
+    assert client.list_like_reactors("chats/1/messages/a") == ["Person"]
+    assert len(session.posted_payloads) == 2
+
+
+def test_bulk_lookup_skips_deleted_users():
+    session = _FakeSession(
+        [],
+        [
+            _batch_response(
+                _user_result("0", "A"),
+                {"id": "1", "status": 404, "body": {"error": {"code": "Request_ResourceNotFound"}}},
+            )
+        ],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    assert client._fetch_user_display_names_bulk(["u1", "gone"]) == ["A", None]
+
+
+def test_bulk_lookup_requeues_server_errors(monkeypatch):
+    monkeypatch.setattr("automation.teams_responses.time.sleep", lambda _: None)
+    session = _FakeSession(
+        [],
+        [
+            _batch_response(_user_result("0", "A"), {"id": "1", "status": 503, "body": {}}),
+            _batch_response(_user_result("0", "B")),
+        ],
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+    )
+
+    assert client._fetch_user_display_names_bulk(["u1", "u2"]) == ["A", "B"]
+    assert session.posted_payloads[1]["requests"][0]["url"] == "/users/u2?$select=displayName"
+
+
+def test_bulk_lookup_raises_when_retries_are_exhausted(monkeypatch):
+    monkeypatch.setattr("automation.teams_responses.time.sleep", lambda _: None)
+    throttled = {"id": "0", "status": 429, "headers": {"Retry-After": "1"}}
+    session = _FakeSession([], [_batch_response(throttled), _batch_response(throttled)])
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+        max_retries=1,
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client._fetch_user_display_names_bulk(["u1"])
+
+
+@pytest.mark.parametrize("use_batch", [True, False])
+@pytest.mark.parametrize("status", [401, 403])
+def test_lookup_auth_errors_fail_the_call(use_batch, status):
+    base = "https://graph.microsoft.com/v1.0"
+    error = {"error": {"code": "Authorization_RequestDenied"}}
+
+    class _Session(_RoutingSession):
+        def post(self, url: str, json: dict, timeout: int):
+            return _batch_response({"id": "0", "status": status, "body": error})
+
+    session = _Session(
+        {
+            f"{base}/chats/1/messages/abc/reactions{_REACTIONS_QUERY}": (
+                _likes_page("u1")
+            ),
+            f"{base}/users/u1?$select=displayName": _FakeResponse(status, error),
+        }
+    )
+    client = TeamsReactionsClient(
+        access_token="token",
+        session=session,
+        logger=logging.getLogger("tests.teams_reactions"),
+        use_batch=use_batch,
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.list_like_reactors("chats/1/messages/abc")
 
 
 def test_list_like_reactors_raises_on_error():
@@ -99,8 +610,8 @@ def test_convenience_wrapper_uses_client_defaults(monkeypatch):
                         "value": [{"reactionType": "like", "user": {"id": "u1"}}],
                     },
                 ),
-                _FakeResponse(200, {"displayName": "Person"}),
-            ]
+            ],
+            [_batch_response(_user_result("0", "Person"))],
         )
         kwargs["access_token"] = access_token
         original_init(self, **kwargs)
@@ -112,3 +623,60 @@ def test_convenience_wrapper_uses_client_defaults(monkeypatch):
 
     assert names == ["Person"]
     assert captured_access_token["token"] == "token-123"
+
+
+def test_client_built_sessions_share_one_adapter():
+    first = TeamsReactionsClient(access_token="a", logger=logging.getLogger("tests"))
+    second = TeamsReactionsClient(access_token="b", logger=logging.getLogger("tests"))
+
+    assert first.session is not second.session
+    assert first.session.get_adapter("https://graph.microsoft.com") is (
+        second.session.get_adapter("https://graph.microsoft.com")
+    )
+
+
+def test_custom_retry_settings_get_their_own_adapter():
+    shared = TeamsReactionsClient(access_token="a", logger=logging.getLogger("tests"))
+    custom = TeamsReactionsClient(
+        access_token="b", logger=logging.getLogger("tests"), max_retries=5
+    )
+
+    shared_adapter = shared.session.get_adapter("https://graph.microsoft.com")
+    custom_adapter = custom.session.get_adapter("https://graph.microsoft.com")
+    assert custom_adapter is not shared_adapter
+    assert custom_adapter.max_retries.total == 5
+    assert "POST" in shared_adapter.max_retries.allowed_methods
+
+
+def test_http_cache_dir_requires_cachecontrol(monkeypatch, tmp_path):
+    monkeypatch.setattr("automation.teams_responses.CacheControlAdapter", None)
+
+    with pytest.raises(ImportError, match="cachecontrol"):
+        TeamsReactionsClient(
+            access_token="token",
+            logger=logging.getLogger("tests"),
+            http_cache_dir=str(tmp_path),
+        )
+
+
+def test_http_cache_dir_mounts_caching_adapter(tmp_path):
+    cachecontrol = pytest.importorskip("cachecontrol")
+    pytest.importorskip("filelock")
+    client = TeamsReactionsClient(
+        access_token="token",
+        logger=logging.getLogger("tests"),
+        http_cache_dir=str(tmp_path),
+    )
+
+    adapter = client.session.get_adapter("https://graph.microsoft.com")
+    assert isinstance(adapter, cachecontrol.CacheControlAdapter)
+
+
+def test_http_cache_dir_rejects_caller_session(tmp_path):
+    with pytest.raises(ValueError, match="http_cache_dir"):
+        TeamsReactionsClient(
+            access_token="token",
+            session=_FakeSession([]),
+            logger=logging.getLogger("tests"),
+            http_cache_dir=str(tmp_path),
+        )